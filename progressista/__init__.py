@@ -12,9 +12,37 @@ else:
     except _metadata.PackageNotFoundError:
         pass
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .client import RemoteTqdm, make_remote_tqdm
+    from .patch import install as install_patch
+    from .server import create_app, run_server
+
+# Public names resolved on first access (PEP 562) so light entry points such as
+# `progressista version` do not pay for importing requests, tqdm, and FastAPI.
+_LAZY_ATTRS = {
+    "RemoteTqdm": ("client", "RemoteTqdm"),
+    "make_remote_tqdm": ("client", "make_remote_tqdm"),
+    "install_patch": ("patch", "install"),
+    "create_app": ("server", "create_app"),
+    "run_server": ("server", "run_server"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
 
-from .client import RemoteTqdm, make_remote_tqdm
-from .patch import install as install_patch
-from .server import create_app, run_server
 
 __all__ = ["RemoteTqdm", "make_remote_tqdm", "install_patch", "create_app", "run_server"]
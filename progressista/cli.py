@@ -6,15 +6,13 @@ import json
 import runpy
 import sys
 import time
+from dataclasses import asdict, replace
 from pathlib import Path
 from typing import Any, List, Optional
 
 import typer
 
 from . import __version__
-from .client import RemoteTqdm
-from .patch import install as install_patch
-from .server import run_server
 from .settings import ClientSettings, ServerSettings
 
 app = typer.Typer(add_completion=False, help="Remote progress dashboards for tqdm.")
@@ -39,11 +37,12 @@ def show_config() -> None:
     typer.echo(
         json.dumps(
             {
-                "server": ServerSettings().__dict__,
-                "client": ClientSettings().__dict__,
+                "server": asdict(ServerSettings.from_env()),
+                "client": asdict(ClientSettings()),
             },
             indent=2,
             sort_keys=True,
+            default=sorted,  # token sets
         )
     )
 
@@ -70,17 +69,20 @@ def serve(
 ) -> None:
     """Run the Progressista FastAPI server."""
 
-    settings = ServerSettings()
+    from .server import run_server
+
+    overrides: dict[str, Any] = {}
     if host is not None:
-        settings.host = host
+        overrides["host"] = host
     if port is not None:
-        settings.port = port
+        overrides["port"] = port
     if retention_seconds is not None:
-        settings.retention_seconds = retention_seconds
+        overrides["retention_seconds"] = retention_seconds
     if cleanup_interval is not None:
-        settings.cleanup_interval = cleanup_interval
+        overrides["cleanup_interval"] = cleanup_interval
     if allow_origins is not None:
-        settings.allow_origins = tuple(o.strip() for o in allow_origins.split(",") if o.strip())
+        overrides["allow_origins"] = tuple(o.strip() for o in allow_origins.split(",") if o.strip())
+    settings = replace(ServerSettings.from_env(), **overrides)
 
     run_server(settings)
 
@@ -101,6 +103,8 @@ def demo(
 ) -> None:
     """Send demonstration progress bars to a running server."""
 
+    from .client import RemoteTqdm
+
     typer.echo("Starting demo workload...")
     headers = {"Authorization": f"Bearer {api_token}"} if api_token else None
     active_bars = [
@@ -146,6 +150,8 @@ def run(
 ) -> None:
     """Execute a script with Progressista's tqdm patch installed."""
 
+    from .patch import install as install_patch
+
     header_dict = _loads_json("headers", headers)
     if api_token:
         header_dict = header_dict or {}
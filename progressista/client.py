@@ -2,24 +2,168 @@
 
 from __future__ import annotations
 
-import copy
-import queue
+import atexit
+import itertools
+import json
+import os
 import socket
 import threading
 import time
-from typing import Any, Dict, Iterable, Optional, Type, TypeVar, cast
+import uuid
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+from urllib.parse import urlsplit, urlunsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 from tqdm import tqdm
 
 from .settings import ClientSettings
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None  # type: ignore[assignment]
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, which the stdlib encoder accepts
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=128, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every bar so updates reuse pooled keep-alive connections instead of
+# paying a TCP/TLS handshake per POST. Headers are passed per call, never set on
+# the session, so concurrent pushers do not race on shared state.
+_SESSION = _build_session()
+
+# Resolved once; default task ids are hostname:pid:seed:sequence. The random
+# per-process seed keeps ids unique when a restarted job reuses its pid (e.g.
+# PID 1 in a container).
+_HOSTNAME = socket.gethostname()
+_PROCESS_SEED = uuid.uuid4().hex[:8]
+_TASK_COUNTER = itertools.count()
+
+# Fraction of push_every by which a due bar may be held back so that bars which
+# are nearly due can join the same request.
+_ALIGN_FRACTION = 0.25
+
+# Server URLs that answered 404/405 on the bulk endpoint.
+_BULK_UNSUPPORTED: Set[str] = set()
+
+_UDP_SOCKET: Optional[socket.socket] = None
+_UDP_LOCK = threading.Lock()
+
+
+def _bulk_url(url: str) -> str:
+    """Return the bulk endpoint next to ``url``, keeping any query string."""
+
+    parts = urlsplit(url)
+    return urlunsplit(parts._replace(path=parts.path.rstrip("/") + "/bulk"))
+
+
+def _udp_socket() -> socket.socket:
+    global _UDP_SOCKET
+    if _UDP_SOCKET is None:
+        with _UDP_LOCK:
+            if _UDP_SOCKET is None:
+                _UDP_SOCKET = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    return _UDP_SOCKET
+
+
+def _parse_udp_url(url: Optional[str]) -> Optional[Tuple[str, int]]:
+    """Return the resolved ``(ip, port)`` for ``udp://host:port`` URLs.
+
+    Other schemes return ``None``; a ``udp://`` URL that cannot be parsed or
+    resolved raises ``ValueError`` rather than silently dropping every update.
+    """
+
+    if not url or not url.startswith("udp://"):
+        return None
+    parsed = urlsplit(url)
+    try:
+        port = parsed.port
+        if not parsed.hostname or port is None:
+            raise ValueError("expected udp://host:port")
+        return socket.gethostbyname(parsed.hostname), port
+    except (ValueError, OSError) as exc:
+        raise ValueError(f"Invalid UDP server URL {url!r}: {exc}") from exc
+
+
+def _bearer_token(headers: Optional[Dict[str, str]]) -> Optional[str]:
+    for key, value in (headers or {}).items():
+        if key.lower() == "authorization" and value[:7].lower() == "bearer ":
+            return value[7:].strip() or None
+    return None
+
+
 class RemoteTqdmMixin:
     """Mixin that injects remote progress emission into tqdm-compatible classes."""
 
-    _remote_defaults: Dict[str, Any] = {}
+    __slots__ = (
+        "_server_url",
+        "_push_every",
+        "_sync_post",
+        "_request_timeout",
+        "_task_id",
+        "_unit_override",
+        "_meta",
+        "_headers",
+        "_post_url",
+        "_post_timeout",
+        "_post_headers",
+        "_post_target",
+        "_udp_addr",
+        "_udp_token",
+        "_settings",
+        "_flushed",
+        "_latest",
+        "_last_push",
+        "_last_state",
+        "_payload_base",
+        "_update_payload",
+        "_closed",
+    )
+
+    # Read-only per-class defaults; bars read them in place without copying.
+    _remote_defaults: Mapping[str, Any] = MappingProxyType({})
     _is_progressista_remote = True
 
+    # One pusher thread shared by every bar so updates from concurrent bars are
+    # coalesced into bulk requests. Bars holding an unsent payload sit in
+    # _GLOBAL_PENDING and _GLOBAL_WAKE tells the pusher to look at them.
+    _GLOBAL_PENDING: Set["RemoteTqdmMixin"] = set()
+    _GLOBAL_PENDING_LOCK = threading.Lock()
+    _GLOBAL_WAKE = threading.Event()
+    _GLOBAL_STOPPED = False
+    _GLOBAL_THREAD: Optional[threading.Thread] = None
+    _GLOBAL_LOCK = threading.Lock()
+
     def __init__(
         self,
         iterable: Optional[Iterable[Any]] = None,
@@ -33,7 +177,7 @@ class RemoteTqdmMixin:
         headers: Optional[Dict[str, str]] = None,
         **kwargs: Any,
     ) -> None:
-        defaults = dict(getattr(self.__class__, "_remote_defaults", {}) or {})
+        defaults = self._remote_defaults
         settings = ClientSettings()
 
         server_default = defaults.get("server_url")
@@ -48,6 +192,8 @@ class RemoteTqdmMixin:
         if self._push_every is None:
             self._push_every = settings.push_interval
         self._push_every = float(self._push_every)
+        # push_every=0 asks for every update: post inline, no pusher round-trip.
+        self._sync_post = self._push_every == 0
 
         timeout_default = defaults.get("request_timeout", settings.request_timeout)
         self._request_timeout = (
@@ -65,25 +211,65 @@ class RemoteTqdmMixin:
         unit_default = defaults.get("unit")
         self._unit_override = unit if unit is not None else unit_default
 
-        meta_default = defaults.get("meta")
-        self._meta = copy.deepcopy(meta_default) if meta is None and meta_default is not None else meta
+        # The client only ever reads meta (it is serialised as-is), so the class
+        # default can be shared by reference. Headers are a flat str mapping.
+        self._meta = meta if meta is not None else defaults.get("meta")
 
         headers_default = defaults.get("headers")
         self._headers = (
-            copy.deepcopy(headers_default)
+            dict(headers_default)
             if headers is None and headers_default is not None
             else headers
         )
         if self._headers is None and settings.api_token:
             self._headers = {"Authorization": f"Bearer {settings.api_token}"}
+        # Everything _post needs is resolved once here instead of on every flush.
+        # Bodies are pre-encoded bytes, so the content type travels with the headers.
+        self._post_url = str(self._server_url)
+        self._post_timeout = float(self._request_timeout)
+        self._post_headers = {**(self._headers or {}), "Content-Type": "application/json"}
+        # Bars with equal targets are flushed together in one bulk request.
+        self._post_target = (
+            self._post_url,
+            self._post_timeout,
+            tuple(sorted(self._post_headers.items())),
+        )
+        # Datagrams cannot carry headers; the server also accepts meta["_token"].
+        try:
+            self._udp_addr = _parse_udp_url(self._server_url)
+        except ValueError:
+            self._closed = True  # keep tqdm.__del__ from reporting a half-built bar
+            raise
+        self._udp_token = _bearer_token(self._headers) if self._udp_addr else None
 
         self._settings = settings
-        self._stop_event = threading.Event()
-        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+        self._flushed = threading.Event()
+        self._latest: Optional[Dict[str, Any]] = None
+        self._last_push = float("-inf")
+        self._last_state: Optional[Tuple[Any, Any, Any]] = None
+
+        # Fields that never change for this bar, resolved once instead of being
+        # re-derived on every emission.
+        self._payload_base: Dict[str, Any] = {"task_id": self._task_id}
+        if self._unit_override:
+            self._payload_base["unit"] = self._unit_override
+        if self._meta is not None:
+            self._payload_base["meta"] = self._meta
+
+        # Reused for every "update" emission; the pusher copies it before posting.
+        self._update_payload: Dict[str, Any] = {
+            **self._payload_base,
+            "status": "update",
+            "n": 0,
+            "total": None,
+            "desc": None,
+            "timestamp": 0.0,
+        }
 
         super().__init__(iterable, *args, **kwargs)  # type: ignore[misc]
 
-        self._start_worker()
+        if not self._sync_post:
+            self._ensure_worker()
         self._emit(
             status="start",
             n=self.n,
@@ -94,82 +280,208 @@ class RemoteTqdmMixin:
 
     # --------------------------------------------------------------------- util
     def _default_task_id(self) -> str:
-        hostname = socket.gethostname()
-        return f"{hostname}:{int(time.time())}:{id(self)}"
+        return f"{_HOSTNAME}:{os.getpid()}:{_PROCESS_SEED}:{next(_TASK_COUNTER)}"
 
     def _post(self, payload: Dict[str, Any]) -> None:
+        if self._udp_addr is not None:
+            self._send_datagram(payload)
+            return
         try:
-            requests.post(
-                cast(str, self._server_url),
-                json=payload,
-                timeout=cast(float, self._request_timeout),
-                headers=self._headers,
+            _SESSION.post(
+                self._post_url,
+                data=_dumps(payload),
+                timeout=self._post_timeout,
+                headers=self._post_headers,
             )
         except Exception:
             # Silent failure; server availability should not break progress loops.
             pass
 
-    def _worker(self) -> None:
-        last_push = 0.0
-        buffered: Dict[str, Any] | None = None
+    def _send_datagram(self, payload: Dict[str, Any]) -> None:
+        if self._udp_token:
+            meta = dict(payload.get("meta") or {})
+            meta["_token"] = self._udp_token
+            payload = {**payload, "meta": meta}
+        try:
+            _udp_socket().sendto(_dumps(payload), cast(Tuple[str, int], self._udp_addr))
+        except Exception:
+            pass
 
-        while not self._stop_event.is_set():
+    def _post_bulk(self, payloads: List[Dict[str, Any]]) -> None:
+        """POST several payloads sharing this bar's endpoint in a single request."""
+
+        url = self._post_url
+        if self._udp_addr is None and url not in _BULK_UNSUPPORTED:
+            encoded: List[bytes] = []
+            for payload in payloads:
+                try:
+                    encoded.append(_dumps(payload))
+                except Exception:
+                    # An unserialisable payload only costs its own bar the update.
+                    continue
+            if not encoded:
+                return
             try:
-                item = self._queue.get(timeout=0.1)
-                buffered = item
-            except queue.Empty:
-                item = None
-
-            now = time.time()
-            if buffered and (now - last_push >= cast(float, self._push_every)):
-                self._post(buffered)
-                last_push = now
-                buffered = None
-
-        # Drain the remaining buffer on shutdown.
-        if buffered:
-            self._post(buffered)
-        # Flush rest of the queue so close() pushes last events.
-        while True:
-            try:
-                pending = self._queue.get_nowait()
-            except queue.Empty:
-                break
-            self._post(pending)
+                response = _SESSION.post(
+                    _bulk_url(url),
+                    data=b"[" + b",".join(encoded) + b"]",
+                    timeout=self._post_timeout,
+                    headers=self._post_headers,
+                )
+            except Exception:
+                return
+            if response.status_code not in (404, 405):
+                return
+            # Older servers without the bulk endpoint; remember and fall back.
+            _BULK_UNSUPPORTED.add(url)
+        for payload in payloads:
+            self._post(payload)
+
+    @staticmethod
+    def _flush(entries: Iterable[Tuple["RemoteTqdmMixin", Dict[str, Any]]]) -> None:
+        groups: Dict[Tuple[Any, ...], List[Tuple[RemoteTqdmMixin, Dict[str, Any]]]] = {}
+        for bar, payload in entries:
+            groups.setdefault(bar._post_target, []).append((bar, payload))
+
+        for group in groups.values():
+            bar = group[0][0]
+            if len(group) == 1:
+                bar._post(group[0][1])
+            else:
+                bar._post_bulk([payload for _, payload in group])
+            for member, payload in group:
+                if payload.get("status") == "close":
+                    member._flushed.set()
+
+    @staticmethod
+    def _worker() -> None:
+        cls = RemoteTqdmMixin
+        timeout: Optional[float] = None
 
-    def _start_worker(self) -> None:
-        thread = threading.Thread(target=self._worker, name="RemoteTqdmPusher", daemon=True)
-        thread.start()
-        self._thread = thread
+        while True:
+            # Sleep until a bar signals a new payload or the next throttled bar is due.
+            cls._GLOBAL_WAKE.wait(timeout)
+            cls._GLOBAL_WAKE.clear()
+            stopping = cls._GLOBAL_STOPPED
+
+            now = time.monotonic()  # throttle clock; payload timestamps stay wall-clock
+            due: List[Tuple[RemoteTqdmMixin, Dict[str, Any]]] = []
+            with cls._GLOBAL_PENDING_LOCK:
+                waits = {
+                    bar: (
+                        0.0
+                        if stopping or cast(Dict[str, Any], bar._latest).get("status") == "close"
+                        else cast(float, bar._push_every) - (now - bar._last_push)
+                    )
+                    for bar in cls._GLOBAL_PENDING
+                }
+                hold: Optional[float] = None
+                overdue = [bar for bar, wait in waits.items() if wait <= 0]
+                if overdue and not stopping and not any(
+                    cast(Dict[str, Any], bar._latest).get("status") == "close" for bar in overdue
+                ):
+                    # Hold due bars briefly for bars that are nearly due, so bars
+                    # updated together share windows and go out as one bulk
+                    # request. Bars are only ever delayed, never sent early.
+                    budget = min(
+                        _ALIGN_FRACTION * cast(float, bar._push_every) + waits[bar]
+                        for bar in overdue
+                    )
+                    nearly = [wait for wait in waits.values() if 0 < wait <= budget]
+                    if nearly:
+                        hold = max(nearly)
+                for bar, wait in waits.items():
+                    if hold is not None or wait > 0:
+                        continue
+                    # Copy under the lock: _emit_update mutates the update payload
+                    # in place while holding it, so the copy is never torn.
+                    payload = dict(cast(Dict[str, Any], bar._latest))
+                    cls._GLOBAL_PENDING.discard(bar)
+                    bar._latest = None
+                    state = (payload.get("n"), payload.get("total"), payload.get("desc"))
+                    if payload.get("status") == "update" and state == bar._last_state:
+                        # Nothing visible changed since the previous push.
+                        continue
+                    bar._last_state = state
+                    bar._last_push = now
+                    due.append((bar, payload))
+                timeout = hold if hold is not None else min(
+                    (wait for wait in waits.values() if wait > 0), default=None
+                )
+            if due:
+                cls._flush(due)
+            if stopping:
+                return
+
+    @staticmethod
+    def _ensure_worker() -> None:
+        worker = RemoteTqdmMixin._GLOBAL_THREAD
+        if worker is not None and worker.is_alive():
+            return
+        with RemoteTqdmMixin._GLOBAL_LOCK:
+            worker = RemoteTqdmMixin._GLOBAL_THREAD
+            if worker is not None and worker.is_alive():
+                return
+            worker = threading.Thread(
+                target=RemoteTqdmMixin._worker, name="RemoteTqdmPusher", daemon=True
+            )
+            worker.start()
+            RemoteTqdmMixin._GLOBAL_THREAD = worker
 
     def _emit(self, **payload: Any) -> None:
-        payload.setdefault("task_id", self._task_id)
-        payload.setdefault("timestamp", time.time())
-        if "unit" not in payload and self._unit_override:
-            payload["unit"] = self._unit_override
-        if self._meta is not None and "meta" not in payload:
-            payload["meta"] = self._meta
-        self._queue.put(payload)
+        self._submit({**self._payload_base, "timestamp": time.time(), **payload})
+
+    def _emit_update(self) -> None:
+        payload = self._update_payload
+        # The pusher may be copying this dict; change it under the same lock.
+        with RemoteTqdmMixin._GLOBAL_PENDING_LOCK:
+            payload["n"] = self.n
+            payload["total"] = self.total
+            payload["desc"] = self.desc
+            payload["timestamp"] = time.time()
+        self._submit(payload)
+
+    def _submit(self, payload: Dict[str, Any]) -> None:
+        cls = RemoteTqdmMixin
+        if self._sync_post or cls._GLOBAL_STOPPED:
+            # Unthrottled bar, or the pusher is gone (interpreter shutdown):
+            # deliver inline.
+            self._post(dict(payload))
+            return
+        # Single latest-wins slot per bar: a newer payload replaces any unsent one.
+        with cls._GLOBAL_PENDING_LOCK:
+            self._latest = payload
+            cls._GLOBAL_PENDING.add(self)
+        if not cls._GLOBAL_WAKE.is_set():
+            cls._GLOBAL_WAKE.set()
+        if cls._GLOBAL_THREAD is None:
+            # Bars inherited across fork() need the child's own pusher.
+            cls._ensure_worker()
 
     # ------------------------------------------------------------------ tqdm API
     def update(self, n: int = 1) -> None:  # type: ignore[override]
         super().update(n)
-        self._emit(status="update", n=self.n, total=self.total, desc=self.desc)
+        self._emit_update()
 
     def set_description(self, desc: Optional[str] = None, refresh: bool = True) -> None:
+        previous = self.desc
         super().set_description(desc, refresh)
-        self._emit(status="update", n=self.n, total=self.total, desc=self.desc)
+        # Re-titling to the same text is common in loops; only a real change is news.
+        if self.desc != previous:
+            self._emit_update()
 
     def close(self) -> None:  # type: ignore[override]
         if getattr(self, "_closed", False):
             return
+        self._closed = True
         try:
             super().close()
         finally:
             self._emit(status="close", n=self.n, total=self.total, desc=self.desc)
-            self._stop_event.set()
-            if hasattr(self, "_thread"):
-                self._thread.join(timeout=cast(float, self._request_timeout))
+            # Block until the shared pusher delivered the final event so it is
+            # never overtaken by an earlier update still in flight.
+            if not (self._sync_post or RemoteTqdmMixin._GLOBAL_STOPPED):
+                self._flushed.wait(timeout=self._post_timeout)
 
 
 BaseTqdmType = TypeVar("BaseTqdmType", bound=tqdm)
@@ -183,7 +495,7 @@ def make_remote_tqdm(
 
     attrs: Dict[str, Any] = {
         "__module__": __name__,
-        "_remote_defaults": dict(defaults),
+        "_remote_defaults": MappingProxyType(dict(defaults)),
     }
     return cast(
         Type[BaseTqdmType],
@@ -191,6 +503,41 @@ def make_remote_tqdm(
     )
 
 
+def _shutdown_worker() -> None:
+    RemoteTqdmMixin._GLOBAL_STOPPED = True
+    worker = RemoteTqdmMixin._GLOBAL_THREAD
+    if worker is None or not worker.is_alive():
+        return
+    RemoteTqdmMixin._GLOBAL_WAKE.set()
+    worker.join(timeout=ClientSettings().request_timeout)
+
+
+atexit.register(_shutdown_worker)
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own connections and pusher state.
+
+    The child must not share the parent's pooled sockets, inherit locks that
+    were held at fork time, or re-send payloads the parent's pusher still owns.
+    """
+
+    global _SESSION, _UDP_SOCKET, _UDP_LOCK, _PROCESS_SEED
+    _PROCESS_SEED = uuid.uuid4().hex[:8]
+    _SESSION = _build_session()
+    _UDP_SOCKET = None
+    _UDP_LOCK = threading.Lock()
+    cls = RemoteTqdmMixin
+    cls._GLOBAL_PENDING = set()
+    cls._GLOBAL_PENDING_LOCK = threading.Lock()
+    cls._GLOBAL_WAKE = threading.Event()
+    cls._GLOBAL_THREAD = None
+    cls._GLOBAL_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 RemoteTqdm = make_remote_tqdm(tqdm)
 
 
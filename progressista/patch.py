@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import importlib
+import sys
+from types import MappingProxyType, ModuleType
 from typing import Any, Dict, Iterable, Tuple, Type
 
 from .client import RemoteTqdmMixin, make_remote_tqdm
@@ -30,7 +32,7 @@ def install(**defaults: Any) -> None:
     for target in list(targets) + list(optional_targets):
         module_name, attr = target
         try:
-            module = importlib.import_module(module_name)
+            module = _load_module(module_name)
         except ImportError:
             continue
 
@@ -50,7 +52,7 @@ def install(**defaults: Any) -> None:
 
     # Keep handy aliases on the root tqdm package coherent after patching.
     try:
-        base_module = importlib.import_module("tqdm")
+        base_module = _load_module("tqdm")
     except ImportError:
         return
     for name in ("tqdm",):
@@ -65,18 +67,26 @@ def uninstall() -> None:
 
     for (module_name, attr), original in list(_PATCHED.items()):
         try:
-            module = importlib.import_module(module_name)
+            module = _load_module(module_name)
         except ImportError:
             continue
         setattr(module, attr, original)
     _PATCHED.clear()
 
 
+def _load_module(module_name: str) -> ModuleType:
+    # Skip the import machinery (and its lock) for modules that are already loaded.
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    return importlib.import_module(module_name)
+
+
 def _update_defaults(remote_cls: Type[Any], defaults: Dict[str, Any]) -> None:
     if not defaults:
         return
     current = getattr(remote_cls, "_remote_defaults", {})
-    updated = {**current, **defaults}
+    updated = MappingProxyType({**current, **defaults})
     setattr(remote_cls, "_remote_defaults", updated)
 
 
@@ -6,23 +6,64 @@ import asyncio
 import contextlib
 import json
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from importlib import resources
 from pathlib import Path
-from typing import Any, Dict, Set
+from typing import Any, Awaitable, Callable, Dict, List, Set
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request, status
+from fastapi import Depends, FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 from . import __version__
 from .settings import ServerSettings
 
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib codec
+    orjson = None  # type: ignore[assignment]
+
 LOGGER = logging.getLogger("progressista.server")
 
+# Task log size that triggers folding it back into the snapshot file.
+_LOG_COMPACT_BYTES = 1 << 20
+# Snapshots a watcher may lag behind before its backlog is dropped.
+_WATCHER_QUEUE_SIZE = 16
+
+
+def _dumps(data: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits in client meta; the stdlib handles them
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _log_path(storage_path: Path) -> Path:
+    """Return the task log kept next to ``storage_path`` (``state.json.log``)."""
+
+    return storage_path.with_name(storage_path.name + ".log")
+
+
+def _loads(raw: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _JSONResponse(JSONResponse):
+    """Default response class: encodes bodies with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
 
 class ProgressEvent(BaseModel):
     """Payload received from clients to describe task progress."""
@@ -42,11 +83,64 @@ class ProgressEvent(BaseModel):
     )
 
 
+_EVENT_LIST = TypeAdapter(List[ProgressEvent])
+
+
+def _json_body(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """OpenAPI request body for routes that validate the raw body themselves."""
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}},
+        }
+    }
+
+
+_EVENT_SCHEMA = ProgressEvent.model_json_schema()
+
+
+def _validation_error(exc: ValidationError) -> RequestValidationError:
+    return RequestValidationError(exc.errors(include_url=False))
+
+
+async def _read_progress_event(request: Request) -> ProgressEvent:
+    """Validate the raw request body straight into a :class:`ProgressEvent`."""
+
+    try:
+        return ProgressEvent.model_validate_json(await request.body())
+    except ValidationError as exc:
+        raise _validation_error(exc) from None
+
+
+async def _read_progress_events(request: Request) -> List[ProgressEvent]:
+    """Validate a raw JSON array body into a list of :class:`ProgressEvent`."""
+
+    try:
+        return _EVENT_LIST.validate_json(await request.body())
+    except ValidationError as exc:
+        raise _validation_error(exc) from None
+
+
+class _DatagramProtocol(asyncio.DatagramProtocol):
+    """Hands every received UDP datagram to an async handler."""
+
+    def __init__(self, handler: Callable[[bytes], Awaitable[None]]) -> None:
+        self._handler = handler
+        self._pending: Set[asyncio.Task[None]] = set()
+
+    def datagram_received(self, data: bytes, addr: Any) -> None:
+        task = asyncio.ensure_future(self._handler(data))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+
 def _extract_bearer(header: str | None) -> str | None:
     if not header:
         return None
     header = header.strip()
-    if not header.lower().startswith("bearer "):
+    # Case-fold only the scheme, not the whole (possibly long) header.
+    if header[:7].lower() != "bearer ":
         return None
     return header[7:].strip() or None
 
@@ -54,8 +148,8 @@ def _extract_bearer(header: str | None) -> str | None:
 def create_app(settings: ServerSettings | None = None) -> FastAPI:
     """Create and configure the FastAPI application."""
 
-    settings = settings or ServerSettings()
-    app = FastAPI(title="Progressista", version=__version__)
+    settings = settings or ServerSettings.from_env()
+    app = FastAPI(title="Progressista", version=__version__, default_response_class=_JSONResponse)
     static_dir = resources.files("progressista") / "static"
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 
@@ -72,25 +166,64 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
     # Mutable state kept on the app object.
     app.state.tasks: Dict[str, Dict[str, Any]] = {}
     app.state.state_lock = asyncio.Lock()
-    app.state.watchers: Set[WebSocket] = set()
+    # Each watcher maps to the queue of frames waiting to be sent to it.
+    app.state.watchers: Dict[WebSocket, asyncio.Queue[str]] = {}
     app.state.watchers_lock = asyncio.Lock()
     app.state.settings = settings
+    # Deployments without tokens skip token extraction on every request.
+    app.state.auth_enabled = bool(settings.api_tokens)
+    app.state.loop: asyncio.AbstractEventLoop | None = None
     app.state.cleanup_task: asyncio.Task[None] | None = None
+    app.state.flush_task: asyncio.Task[None] | None = None
+    app.state.dirty = asyncio.Event()
+    app.state.snapshot_cache: Dict[str, Dict[str, Any]] | None = None
+    app.state.snapshot_bytes: bytes | None = None
+    app.state.udp_transport: asyncio.DatagramTransport | None = None
     app.state.storage_path = storage_path
     app.state.persist_lock = asyncio.Lock()
+    # Disk writes get their own thread instead of queueing in the default executor.
+    app.state.persist_executor: ThreadPoolExecutor | None = None
+    # Append-only log of per-task changes since the last full snapshot.
+    app.state.log_path = _log_path(storage_path) if storage_path else None
+    app.state.log_fd: int | None = None
+    app.state.log_size = 0
+    app.state.changed_ids: Set[str] = set()
 
     def load_persisted_tasks(path: Path | None) -> Dict[str, Dict[str, Any]]:
-        if not path or not path.exists():
-            return {}
-        try:
-            with path.open("r", encoding="utf-8") as source:
-                payload = json.load(source)
-        except Exception:
-            LOGGER.exception("Failed to load persisted tasks from %s", path)
-            return {}
-        tasks = payload.get("tasks")
-        if not isinstance(tasks, dict):
+        if not path:
             return {}
+        tasks: Dict[str, Any] = {}
+        if path.exists():
+            try:
+                payload = _loads(path.read_bytes())
+            except Exception:
+                LOGGER.exception("Failed to load persisted tasks from %s", path)
+                return {}
+            snapshot = payload.get("tasks") if isinstance(payload, dict) else None
+            if isinstance(snapshot, dict):
+                tasks.update(snapshot)
+
+        # Replay changes appended after the snapshot was written.
+        log_path = _log_path(path)
+        if log_path.exists():
+            try:
+                lines = log_path.read_bytes().splitlines()
+            except Exception:
+                LOGGER.exception("Failed to read task log %s", log_path)
+                lines = []
+            for line in lines:
+                try:
+                    entry = _loads(line)
+                except Exception:
+                    continue  # torn final write
+                task_id = entry.get("task_id") if isinstance(entry, dict) else None
+                if not isinstance(task_id, str):
+                    continue
+                if entry.get("removed"):
+                    tasks.pop(task_id, None)
+                elif isinstance(entry.get("task"), dict):
+                    tasks[task_id] = entry["task"]
+
         now = time.time()
         restored: Dict[str, Dict[str, Any]] = {}
         for task_id, raw in tasks.items():
@@ -99,7 +232,9 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
             task = dict(raw)
             task["task_id"] = task.get("task_id", task_id)
             task.setdefault("created_at", now)
-            task.setdefault("updated_at", task.get("created_at", now))
+            # Cleanup and bulk delete read ``updated_at`` without fallbacks.
+            if not isinstance(task.get("updated_at"), (int, float)):
+                task["updated_at"] = task["created_at"]
             status = str(task.get("status", "recovered") or "recovered")
             if status == "close":
                 task["status"] = "close"
@@ -112,34 +247,82 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
             restored[task_id] = task
         return restored
 
-    async def persist_state(snapshot: Dict[str, Dict[str, Any]]) -> None:
-        path: Path | None = app.state.storage_path
-        if not path:
+    def log_fd() -> int:
+        if app.state.log_fd is None:
+            app.state.log_fd = os.open(
+                app.state.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        return app.state.log_fd
+
+    async def append_log(task_ids: Set[str]) -> None:
+        """Append the current state of ``task_ids`` to the task log."""
+
+        if not app.state.storage_path or not task_ids:
             return
-        data = {
-            "tasks": snapshot,
-            "version": __version__,
-            "saved_at": time.time(),
-        }
-        json_payload = json.dumps(data, ensure_ascii=True, separators=(",", ":"))
         async with app.state.persist_lock:
-            loop = asyncio.get_running_loop()
+            # Encode under the lock so entries never predate a concurrent compaction.
+            tasks = app.state.tasks
+            lines = b"".join(
+                _dumps({"task_id": task_id, "task": tasks[task_id]} if task_id in tasks
+                       else {"task_id": task_id, "removed": True}) + b"\n"
+                for task_id in task_ids
+            )
+            try:
+                await app.state.loop.run_in_executor(
+                    app.state.persist_executor, os.write, log_fd(), lines
+                )
+            except Exception:
+                LOGGER.exception("Failed to append to task log %s", app.state.log_path)
+            else:
+                app.state.log_size += len(lines)
+
+    def write_snapshot(payload: bytes) -> None:
+        """Atomically replace the snapshot file and empty the log it supersedes."""
 
-            def write_snapshot() -> None:
-                tmp_path = path.with_suffix(".tmp")
-                with tmp_path.open("w", encoding="utf-8") as target:
-                    target.write(json_payload)
-                tmp_path.replace(path)
+        path: Path = app.state.storage_path
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(payload)
+        tmp_path.replace(path)
+        if app.state.log_fd is not None:
+            os.ftruncate(app.state.log_fd, 0)
+        elif app.state.log_path.exists():
+            os.truncate(app.state.log_path, 0)
 
+    async def persist_state() -> None:
+        """Write a full snapshot and reset the task log it supersedes."""
+
+        path: Path | None = app.state.storage_path
+        if not path:
+            return
+        async with app.state.persist_lock:
+            payload = await get_snapshot_bytes()
             try:
-                await loop.run_in_executor(None, write_snapshot)
+                await app.state.loop.run_in_executor(
+                    app.state.persist_executor, write_snapshot, payload
+                )
             except Exception:
                 LOGGER.exception("Failed to persist tasks to %s", path)
+            else:
+                app.state.log_size = 0
 
     if storage_path:
         persisted = load_persisted_tasks(storage_path)
         if persisted:
             app.state.tasks.update(persisted)
+        log_path: Path = app.state.log_path
+        app.state.log_size = log_path.stat().st_size if log_path.exists() else 0
+        if app.state.log_size:
+            # Fold the replayed log into the snapshot now, so new entries are
+            # never appended after a torn final line.
+            payload = _dumps(
+                {"tasks": app.state.tasks, "version": __version__, "saved_at": time.time()}
+            )
+            try:
+                write_snapshot(payload)
+            except Exception:
+                LOGGER.exception("Failed to compact task log %s", log_path)
+            else:
+                app.state.log_size = 0
 
     if settings.allow_origins:
         app.add_middleware(
@@ -151,8 +334,39 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
         )
 
     async def get_snapshot() -> Dict[str, Dict[str, Any]]:
-        async with app.state.state_lock:
-            return {k: dict(v) for k, v in app.state.tasks.items()}
+        """Return a copy of all tasks, rebuilt only after the state changed.
+
+        The cached mapping is shared between callers and must not be mutated.
+        """
+
+        snapshot = app.state.snapshot_cache
+        if snapshot is None:
+            # The copy never awaits, so no writer can interleave with it and it
+            # does not need to queue behind ``state_lock``.
+            snapshot = {k: dict(v) for k, v in app.state.tasks.items()}
+            app.state.snapshot_cache = snapshot
+        return snapshot
+
+    async def get_snapshot_bytes() -> bytes:
+        """Return the encoded snapshot shared by the state file and watchers."""
+
+        payload = app.state.snapshot_bytes
+        if payload is None:
+            snapshot = await get_snapshot()
+            payload = _dumps({"tasks": snapshot, "version": __version__, "saved_at": time.time()})
+            app.state.snapshot_bytes = payload
+        return payload
+
+    def invalidate_snapshot() -> None:
+        app.state.snapshot_cache = None
+        app.state.snapshot_bytes = None
+
+    def mark_dirty(*task_ids: str) -> None:
+        """Invalidate the snapshot and schedule a coalesced persist + broadcast."""
+
+        invalidate_snapshot()
+        app.state.changed_ids.update(task_ids)
+        app.state.dirty.set()
 
     def require_token(*candidates: str | None) -> None:
         tokens = app.state.settings.api_tokens
@@ -181,168 +395,248 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
             while True:
                 await asyncio.sleep(settings.cleanup_interval)
                 now = time.time()
-                updated = False
+                # Disabled policies get a cutoff no timestamp can fall below.
+                never = float("-inf")
+                retention_cutoff = (
+                    now - settings.retention_seconds if settings.retention_seconds > 0 else never
+                )
+                max_age_cutoff = now - settings.max_task_age if settings.max_task_age > 0 else never
+                stale_cutoff = now - settings.stale_seconds if settings.stale_seconds > 0 else never
                 async with app.state.state_lock:
-                    stale_ids = [
-                        task_id
-                        for task_id, data in list(app.state.tasks.items())
-                        if data.get("status") == "close"
-                        and settings.retention_seconds > 0
-                        and now - data.get("updated_at", data.get("created_at", now))
-                        > settings.retention_seconds
-                    ]
-
-                    removed_ids = list(stale_ids)
-                    stale_changed = False
-
-                    if settings.max_task_age > 0:
-                        for task_id, data in list(app.state.tasks.items()):
-                            updated_at = data.get("updated_at", data.get("created_at", now))
-                            if now - updated_at > settings.max_task_age:
+                    removed_ids: list[str] = []
+                    stale_ids: list[str] = []
+                    for task_id, data in app.state.tasks.items():
+                        updated_at = data["updated_at"]
+                        status_val = data.get("status")
+                        if updated_at < max_age_cutoff:
+                            removed_ids.append(task_id)
+                        elif status_val == "close":
+                            if updated_at < retention_cutoff:
                                 removed_ids.append(task_id)
-
-                    if settings.stale_seconds > 0:
-                        for task_id, data in list(app.state.tasks.items()):
-                            status_val = data.get("status")
-                            updated_at = data.get("updated_at", data.get("created_at", now))
-                            if (
-                                status_val not in ("close", "stale")
-                                and now - updated_at > settings.stale_seconds
-                            ):
-                                data["status"] = "stale"
-                                data.setdefault("stale_at", now)
-                                app.state.tasks[task_id] = data
-                                stale_changed = True
+                        elif status_val != "stale" and updated_at < stale_cutoff:
+                            data["status"] = "stale"
+                            data.setdefault("stale_at", now)
+                            stale_ids.append(task_id)
 
                     for task_id in removed_ids:
                         app.state.tasks.pop(task_id, None)
-
-                    updated = bool(removed_ids) or stale_changed
-                if updated:
-                    snapshot = await get_snapshot()
-                    await persist_state(snapshot)
-                    await broadcast(snapshot)
+                if removed_ids or stale_ids:
+                    # Logged and broadcast by the flusher like any other change.
+                    mark_dirty(*removed_ids, *stale_ids)
         except asyncio.CancelledError:  # pragma: no cover - clean shutdown
             LOGGER.info("Cleanup loop cancelled.")
         except Exception:  # pragma: no cover - defensive logging
             LOGGER.exception("Cleanup loop crashed.")
 
-    async def broadcast(snapshot: Dict[str, Dict[str, Any]]) -> None:
-        if not snapshot:
-            payload = {"tasks": {}}
-        else:
-            payload = {"tasks": snapshot}
-
+    async def broadcast() -> None:
         async with app.state.watchers_lock:
             if not app.state.watchers:
                 return
-            watchers = list(app.state.watchers)
+            # Encoded once per change; queued for every watcher without awaiting sends.
+            message = (await get_snapshot_bytes()).decode("utf-8")
+            for queue in app.state.watchers.values():
+                try:
+                    queue.put_nowait(message)
+                except asyncio.QueueFull:
+                    # Every frame is a full snapshot, so a lagging watcher only
+                    # needs the newest one: drop its backlog, not the watcher.
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(message)
+
+    async def send_frames(ws: WebSocket, queue: asyncio.Queue[str]) -> None:
+        try:
+            while True:
+                await ws.send_text(await queue.get())
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+        except Exception:  # pragma: no cover - network errors
+            LOGGER.debug("Failed to send to watcher.", exc_info=True)
 
-        dead: list[WebSocket] = []
-        for ws in watchers:
-            try:
-                await ws.send_json(payload)
-            except WebSocketDisconnect:
-                dead.append(ws)
-            except RuntimeError:
-                dead.append(ws)
-            except Exception:  # pragma: no cover - network errors
-                LOGGER.debug("Failed to broadcast to watcher.", exc_info=True)
-                dead.append(ws)
-
-        if dead:
-            async with app.state.watchers_lock:
-                for ws in dead:
-                    app.state.watchers.discard(ws)
+    async def flusher() -> None:
+        try:
+            while True:
+                await app.state.dirty.wait()
+                # Let a burst of updates accumulate, then publish them together.
+                await asyncio.sleep(settings.flush_interval)
+                app.state.dirty.clear()
+                changed, app.state.changed_ids = app.state.changed_ids, set()
+                try:
+                    await append_log(changed)
+                    if app.state.log_size > _LOG_COMPACT_BYTES:
+                        # Fold the task log back into the snapshot file.
+                        await persist_state()
+                    await broadcast()
+                except Exception:  # pragma: no cover - defensive logging
+                    # One bad flush must not stop later ones.
+                    LOGGER.exception("Flush failed.")
+        except asyncio.CancelledError:  # pragma: no cover - clean shutdown
+            LOGGER.info("Flusher cancelled.")
+
+    async def handle_datagram(data: bytes) -> None:
+        try:
+            event = ProgressEvent.model_validate_json(data)
+        except ValueError:
+            LOGGER.debug("Ignoring malformed UDP progress datagram.", exc_info=True)
+            return
+        meta_token = pop_meta_token(event)
+        tokens = app.state.settings.api_tokens
+        if tokens and meta_token not in tokens:
+            LOGGER.debug("Ignoring UDP progress datagram with an invalid token.")
+            return
+
+        now = time.time()
+        async with app.state.state_lock:
+            apply_event(event, now)
+        mark_dirty(event.task_id)
 
     @app.on_event("startup")
     async def _startup() -> None:
+        app.state.loop = asyncio.get_running_loop()
+        if app.state.storage_path:
+            app.state.persist_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="progressista-persist"
+            )
         app.state.cleanup_task = asyncio.create_task(cleanup_loop())
+        app.state.flush_task = asyncio.create_task(flusher())
+        if settings.udp_port:
+            app.state.udp_transport, _ = await app.state.loop.create_datagram_endpoint(
+                lambda: _DatagramProtocol(handle_datagram),
+                local_addr=(settings.host, settings.udp_port),
+            )
+            LOGGER.info("Listening for UDP progress datagrams on port %s", settings.udp_port)
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:
+        if app.state.udp_transport:
+            app.state.udp_transport.close()
         if app.state.cleanup_task:
             app.state.cleanup_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await app.state.cleanup_task
+        if app.state.flush_task:
+            app.state.flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await app.state.flush_task
+        if app.state.changed_ids or app.state.log_size:
+            # Leave a compact snapshot behind, including the last flush window.
+            await persist_state()
+        if app.state.log_fd is not None:
+            os.close(app.state.log_fd)
+            app.state.log_fd = None
+        if app.state.persist_executor is not None:
+            app.state.persist_executor.shutdown(wait=True)
+            app.state.persist_executor = None
 
     @app.get("/health")
-    async def health() -> JSONResponse:
-        return JSONResponse({"status": "ok", "tasks": len(app.state.tasks)})
+    async def health() -> Dict[str, Any]:
+        return {"status": "ok", "tasks": len(app.state.tasks)}
 
     @app.get("/tasks")
     async def list_tasks() -> Dict[str, Dict[str, Any]]:
         return {"tasks": await get_snapshot()}
 
-    @app.post("/progress")
-    async def progress(event: ProgressEvent, request: Request) -> Dict[str, Any]:
+    def pop_meta_token(event: ProgressEvent) -> str | None:
         if event.meta and "_token" in event.meta:
-            meta_token = event.meta.pop("_token")
-        else:
-            meta_token = None
-        query_token, header_token = extract_request_tokens(request)
-        require_token(meta_token, query_token, header_token)
-        now = time.time()
-        event_dict = event.dict(exclude_none=True)
-        event_dict.setdefault("timestamp", now)
-        event_dict.setdefault("status", "update")
+            return event.meta.pop("_token")
+        return None
 
-        async with app.state.state_lock:
-            task = app.state.tasks.get(
-                event.task_id,
-                {
-                    "task_id": event.task_id,
-                    "created_at": now,
-                    "n": 0,
-                    "total": None,
-                    "status": "start",
-                },
-            )
+    def apply_event(event: ProgressEvent, now: float) -> None:
+        """Merge ``event`` into the task table; the caller must hold ``state_lock``.
+
+        Every stored task carries ``updated_at`` so scans can index it directly.
+        """
+
+        task = app.state.tasks.get(
+            event.task_id,
+            {
+                "task_id": event.task_id,
+                "created_at": now,
+                "n": 0,
+                "total": None,
+                "status": "start",
+            },
+        )
+
+        if event.desc is not None:
+            task["desc"] = event.desc
+        if event.total is not None:
+            task["total"] = event.total
+        if event.n is not None:
+            task["n"] = event.n
+        if event.unit is not None:
+            task["unit"] = event.unit
+        if event.meta is not None:
+            task["meta"] = event.meta
 
-            if event.desc is not None:
-                task["desc"] = event.desc
-            if event.total is not None:
-                task["total"] = event.total
-            if event.n is not None:
-                task["n"] = event.n
-            if event.unit is not None:
-                task["unit"] = event.unit
-            if event.meta is not None:
-                task["meta"] = event.meta
+        task["status"] = event.status or "update"
+        task["updated_at"] = now
+        task["timestamp"] = now if event.timestamp is None else event.timestamp
 
-            task["status"] = event_dict["status"]
-            task["updated_at"] = now
-            task["timestamp"] = event_dict["timestamp"]
+        if task["status"] == "close":
+            task.setdefault("done_at", now)
 
-            if task["status"] == "close":
-                task.setdefault("done_at", now)
+        task.pop("recovered", None)
+        task.pop("recovered_at", None)
 
-            task.pop("recovered", None)
-            task.pop("recovered_at", None)
+        app.state.tasks[event.task_id] = task
 
-            app.state.tasks[event.task_id] = task
+    @app.post("/progress", openapi_extra=_json_body(_EVENT_SCHEMA))
+    async def progress(
+        request: Request, event: ProgressEvent = Depends(_read_progress_event)
+    ) -> Dict[str, Any]:
+        meta_token = pop_meta_token(event)
+        if app.state.auth_enabled:
+            require_token(meta_token, *extract_request_tokens(request))
 
-        snapshot = await get_snapshot()
-        await persist_state(snapshot)
-        await broadcast(snapshot)
+        now = time.time()
+        async with app.state.state_lock:
+            apply_event(event, now)
+        mark_dirty(event.task_id)
 
         return {"ok": True}
 
+    @app.post(
+        "/progress/bulk", openapi_extra=_json_body({"type": "array", "items": _EVENT_SCHEMA})
+    )
+    async def progress_bulk(
+        request: Request, events: List[ProgressEvent] = Depends(_read_progress_events)
+    ) -> Dict[str, Any]:
+        if app.state.auth_enabled:
+            query_token, header_token = extract_request_tokens(request)
+            for event in events:
+                require_token(pop_meta_token(event), query_token, header_token)
+        else:
+            for event in events:
+                pop_meta_token(event)
+
+        if events:
+            now = time.time()
+            async with app.state.state_lock:
+                for event in events:
+                    apply_event(event, now)
+            mark_dirty(*(event.task_id for event in events))
+
+        return {"ok": True, "count": len(events)}
+
     @app.websocket("/ws")
     async def watch(ws: WebSocket) -> None:
-        tokens: tuple[str, ...] = app.state.settings.api_tokens
+        tokens: frozenset[str] = app.state.settings.api_tokens
         if tokens:
             candidate = ws.query_params.get("token") or _extract_bearer(ws.headers.get("authorization"))
             if not candidate or candidate not in tokens:
                 await ws.close(code=4401, reason="Unauthorized")
                 return
         await ws.accept()
+        # Frames go through a bounded per-watcher queue drained by its own task,
+        # so a slow dashboard only ever delays itself.
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_WATCHER_QUEUE_SIZE)
+        sender = asyncio.create_task(send_frames(ws, queue))
         async with app.state.watchers_lock:
-            app.state.watchers.add(ws)
+            # Queue the current snapshot ahead of any broadcast.
+            queue.put_nowait((await get_snapshot_bytes()).decode("utf-8"))
+            app.state.watchers[ws] = queue
         try:
-            # Send current snapshot immediately.
-            snapshot = await get_snapshot()
-            await ws.send_json({"tasks": snapshot})
             while True:
                 try:
                     await ws.receive_text()
@@ -353,18 +647,17 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
                     break
         finally:
             async with app.state.watchers_lock:
-                app.state.watchers.discard(ws)
+                app.state.watchers.pop(ws, None)
+            sender.cancel()
 
     @app.delete("/tasks/{task_id}")
     async def delete_task(task_id: str, request: Request) -> Dict[str, Any]:
-        query_token, header_token = extract_request_tokens(request)
-        require_token(query_token, header_token)
+        if app.state.auth_enabled:
+            require_token(*extract_request_tokens(request))
         async with app.state.state_lock:
             removed = app.state.tasks.pop(task_id, None)
         if removed:
-            snapshot = await get_snapshot()
-            await persist_state(snapshot)
-            await broadcast(snapshot)
+            mark_dirty(task_id)
         return {"removed": bool(removed)}
 
     @app.delete("/tasks")
@@ -373,24 +666,21 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
         status: str | None = None,
         older_than: float | None = None,
     ) -> Dict[str, Any]:
-        query_token, header_token = extract_request_tokens(request)
-        require_token(query_token, header_token)
+        if app.state.auth_enabled:
+            require_token(*extract_request_tokens(request))
+        cutoff = time.time() - older_than if older_than else None
         async with app.state.state_lock:
-            removed_ids: list[str] = []
-            now = time.time()
-            cutoff = now - older_than if older_than else None
-            for task_id, data in list(app.state.tasks.items()):
-                if status and data.get("status") != status:
-                    continue
-                updated_at = data.get("updated_at", data.get("created_at", now))
-                if cutoff is not None and updated_at > cutoff:
-                    continue
-                removed_ids.append(task_id)
+            # Collect first, then pop: no copy of the whole table is needed.
+            removed_ids = [
+                task_id
+                for task_id, data in app.state.tasks.items()
+                if (not status or data.get("status") == status)
+                and (cutoff is None or data["updated_at"] <= cutoff)
+            ]
+            for task_id in removed_ids:
                 app.state.tasks.pop(task_id, None)
         if removed_ids:
-            snapshot = await get_snapshot()
-            await persist_state(snapshot)
-            await broadcast(snapshot)
+            mark_dirty(*removed_ids)
         return {"removed": removed_ids}
 
     return app
@@ -399,7 +689,7 @@ def create_app(settings: ServerSettings | None = None) -> FastAPI:
 def run_server(settings: ServerSettings | None = None) -> None:
     """Run the Progressista server using uvicorn."""
 
-    settings = settings or ServerSettings()
+    settings = settings or ServerSettings.from_env()
     config = uvicorn.Config(
         "progressista.server:create_app",
         host=settings.host,
@@ -26,32 +26,52 @@ def _int_env(name: str, default: int) -> int:
         return default
 
 
-@dataclass(slots=True)
+def _csv_env(name: str) -> tuple[str, ...]:
+    value = os.getenv(name) or ""
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+@dataclass(frozen=True, slots=True)
 class ServerSettings:
-    """Settings that control the FastAPI server runtime."""
-
-    host: str = os.getenv("PROGRESSISTA_HOST", "0.0.0.0")
-    port: int = _int_env("PROGRESSISTA_PORT", 8000)
-    storage_path: str | None = os.getenv("PROGRESSISTA_STORAGE_PATH")
-    cleanup_interval: float = _float_env("PROGRESSISTA_CLEANUP_INTERVAL", 5.0)
-    retention_seconds: float = _float_env("PROGRESSISTA_RETENTION_SECONDS", 86400.0)
-    stale_seconds: float = _float_env("PROGRESSISTA_STALE_SECONDS", 0.0)
-    max_task_age: float = _float_env("PROGRESSISTA_MAX_TASK_AGE", 0.0)
+    """Settings that control the FastAPI server runtime.
+
+    Instances hold plain defaults; use :meth:`from_env` to read the
+    ``PROGRESSISTA_*`` environment variables.
+    """
+
+    host: str = "0.0.0.0"
+    port: int = 8000
+    storage_path: str | None = None
+    cleanup_interval: float = 5.0
+    flush_interval: float = 0.05
+    retention_seconds: float = 86400.0
+    stale_seconds: float = 0.0
+    max_task_age: float = 0.0
+    udp_port: int = 0
     allow_origins: tuple[str, ...] = ()
-    api_tokens: tuple[str, ...] = ()
-
-    def __post_init__(self) -> None:
-        origins = os.getenv("PROGRESSISTA_ALLOW_ORIGINS")
-        if origins:
-            self.allow_origins = tuple(o.strip() for o in origins.split(",") if o.strip())
-        else:
-            self.allow_origins = ()
-        tokens = os.getenv("PROGRESSISTA_API_TOKENS")
-        if tokens:
-            self.api_tokens = tuple(t.strip() for t in tokens.split(",") if t.strip())
-        else:
+    api_tokens: frozenset[str] = frozenset()
+
+    @classmethod
+    def from_env(cls) -> ServerSettings:
+        """Build settings from the current environment, reading each variable once."""
+
+        tokens = _csv_env("PROGRESSISTA_API_TOKENS")
+        if not tokens:
             token = os.getenv("PROGRESSISTA_API_TOKEN")
-            self.api_tokens = (token,) if token else ()
+            tokens = (token,) if token else ()
+        return cls(
+            host=os.getenv("PROGRESSISTA_HOST", "0.0.0.0"),
+            port=_int_env("PROGRESSISTA_PORT", 8000),
+            storage_path=os.getenv("PROGRESSISTA_STORAGE_PATH"),
+            cleanup_interval=_float_env("PROGRESSISTA_CLEANUP_INTERVAL", 5.0),
+            flush_interval=_float_env("PROGRESSISTA_FLUSH_INTERVAL", 0.05),
+            retention_seconds=_float_env("PROGRESSISTA_RETENTION_SECONDS", 86400.0),
+            stale_seconds=_float_env("PROGRESSISTA_STALE_SECONDS", 0.0),
+            max_task_age=_float_env("PROGRESSISTA_MAX_TASK_AGE", 0.0),
+            udp_port=_int_env("PROGRESSISTA_UDP_PORT", 0),
+            allow_origins=_csv_env("PROGRESSISTA_ALLOW_ORIGINS"),
+            api_tokens=frozenset(tokens),
+        )
 
 
 @dataclass(slots=True)
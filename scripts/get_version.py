@@ -15,6 +15,14 @@ FALLBACK_VERSION = "0.0.0"
 REPO_ROOT = Path(__file__).resolve().parents[1]
 PYPROJECT = REPO_ROOT / "pyproject.toml"
 
+_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+_SECTION_RE = re.compile(r"(?ms)^\[tool\.hatch\.version\]\s*(?P<body>.*?)(?=^\[|\Z)")
+_PATH_RE = re.compile(r'^\s*path\s*=\s*"([^"]+)"', re.MULTILINE)
+_PATTERN_RE = re.compile(r'^\s*pattern\s*=\s*"([^"]+)"', re.MULTILINE)
+_DEFAULT_VERSION_RE = re.compile(
+    r'(?m)^(?:__version__|VERSION)\s*=\s*["\'](?P<version>[^"\']+)["\']'
+)
+
 
 def detect_version() -> str:
     """Return the version from VCS tags, falling back if unavailable."""
@@ -45,7 +53,7 @@ def _version_from_pyproject() -> str | None:
         return None
 
     text = PYPROJECT.read_text()
-    match = re.search(r'^version\s*=\s*"([^"]+)"', text, flags=re.MULTILINE)
+    match = _VERSION_RE.search(text)
     if match:
         return match.group(1)
 
@@ -74,14 +82,12 @@ def _version_from_package() -> str | None:
 
 
 def _extract_hatch_version_section(text: str) -> tuple[str | None, str | None] | None:
-    match = re.search(
-        r"(?ms)^\[tool\.hatch\.version\]\s*(?P<body>.*?)(?=^\[|\Z)", text + "\n", flags=0
-    )
+    match = _SECTION_RE.search(text + "\n")
     if not match:
         return None
     body = match.group("body")
-    path_match = re.search(r'^\s*path\s*=\s*"([^"]+)"', body, flags=re.MULTILINE)
-    pattern_match = re.search(r'^\s*pattern\s*=\s*"([^"]+)"', body, flags=re.MULTILINE)
+    path_match = _PATH_RE.search(body)
+    pattern_match = _PATTERN_RE.search(body)
     path = path_match.group(1) if path_match else None
     pattern = pattern_match.group(1) if pattern_match else None
     return path, pattern
@@ -91,12 +97,7 @@ def _version_from_file(path: Path, pattern: str | None) -> str | None:
     if not path.exists():
         return None
     text = path.read_text()
-    if pattern:
-        regex = re.compile(pattern, flags=re.MULTILINE)
-    else:
-        regex = re.compile(
-            r'(?m)^(?:__version__|VERSION)\s*=\s*["\'](?P<version>[^"\']+)["\']'
-        )
+    regex = re.compile(pattern, flags=re.MULTILINE) if pattern else _DEFAULT_VERSION_RE
     match = regex.search(text)
     if not match:
         return None
@@ -15,7 +15,15 @@ MESON_BUILD = ROOT / "meson.build"
 PACKAGE_INIT = ROOT / "progressista" / "__init__.py"
 
 sys.path.insert(0, str(ROOT / "scripts"))
-from get_version import detect_version, FALLBACK_VERSION  # noqa: E402
+from get_version import (  # noqa: E402
+    FALLBACK_VERSION,
+    _DEFAULT_VERSION_RE,
+    _extract_hatch_version_section,
+    detect_version,
+)
+
+_PYPROJECT_VERSION_RE = re.compile(r'^(version\s*=\s*)"[^"]+"', re.MULTILINE)
+_MESON_VERSION_RE = re.compile(r"^(\s*version:\s*)'[^']+'", re.MULTILINE)
 
 
 def _parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
@@ -31,8 +39,7 @@ def _normalise(version: str) -> str:
     return version[1:] if version.startswith("v") else version
 
 
-def _replace_once(path: Path, pattern: str, repl: str) -> None:
-    regex = re.compile(pattern, flags=re.MULTILINE)
+def _replace_once(path: Path, regex: re.Pattern[str], repl: str) -> None:
     original = path.read_text()
     updated, count = regex.subn(repl, original)
     if count != 1:
@@ -40,30 +47,11 @@ def _replace_once(path: Path, pattern: str, repl: str) -> None:
     path.write_text(updated)
 
 
-def _extract_hatch_version_section(text: str) -> tuple[str | None, str | None]:
-    match = re.search(
-        r"(?ms)^\[tool\.hatch\.version\]\s*(?P<body>.*?)(?=^\[|\Z)", text + "\n", flags=0
-    )
-    if not match:
-        return (None, None)
-    body = match.group("body")
-    path_match = re.search(r'^\s*path\s*=\s*"([^"]+)"', body, flags=re.MULTILINE)
-    pattern_match = re.search(r'^\s*pattern\s*=\s*"([^"]+)"', body, flags=re.MULTILINE)
-    path = path_match.group(1) if path_match else None
-    pattern = pattern_match.group(1) if pattern_match else None
-    return (path, pattern)
-
-
 def _replace_version_in_file(path: Path, version: str, pattern: str | None) -> None:
     if not path.exists():
         raise FileNotFoundError(f"Version file not found: {path}")
 
-    if pattern:
-        regex = re.compile(pattern, flags=re.MULTILINE)
-    else:
-        regex = re.compile(
-            r'(?m)^(?:__version__|VERSION)\s*=\s*["\'](?P<version>[^"\']+)["\']'
-        )
+    regex = re.compile(pattern, flags=re.MULTILINE) if pattern else _DEFAULT_VERSION_RE
 
     original = path.read_text()
     matches = list(regex.finditer(original))
@@ -95,23 +83,15 @@ def main(argv: Optional[list[str]] = None) -> int:
             )
 
     pyproject_text = PYPROJECT.read_text()
-    if re.search(r'^(version\s*=\s*)"[^"]+"', pyproject_text, flags=re.MULTILINE):
-        _replace_once(
-            PYPROJECT,
-            r'^(version\s*=\s*)"[^"]+"',
-            rf'\1"{version}"',
-        )
+    if _PYPROJECT_VERSION_RE.search(pyproject_text):
+        _replace_once(PYPROJECT, _PYPROJECT_VERSION_RE, rf'\1"{version}"')
 
-    hatch_path, hatch_pattern = _extract_hatch_version_section(pyproject_text)
+    hatch_path, hatch_pattern = _extract_hatch_version_section(pyproject_text) or (None, None)
     version_path = ROOT / Path(hatch_path) if hatch_path else PACKAGE_INIT
     _replace_version_in_file(version_path, version, hatch_pattern)
 
     if MESON_BUILD.exists():
-        _replace_once(
-            MESON_BUILD,
-            r"^(\s*version:\s*)'[^']+'",
-            rf"\1'{version}'",
-        )
+        _replace_once(MESON_BUILD, _MESON_VERSION_RE, rf"\1'{version}'")
     print(f"Updated project version to {version}")
     return 0
 
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from progressista import client
+
+
+@pytest.fixture
+def posted(monkeypatch) -> List[Dict[str, Any]]:
+    sent: List[Dict[str, Any]] = []
+    monkeypatch.setattr(client.RemoteTqdmMixin, "_post", lambda self, payload: sent.append(payload))
+    monkeypatch.setattr(
+        client.RemoteTqdmMixin, "_post_bulk", lambda self, payloads: sent.extend(payloads)
+    )
+    return sent
+
+
+class _FakeSession:
+    def __init__(self, bulk_status: int = 200) -> None:
+        self.bulk_status = bulk_status
+        self.calls: List[tuple[str, bytes]] = []
+
+    def post(self, url: str, data: bytes, **kwargs: Any) -> Any:
+        self.calls.append((url, data))
+        status = self.bulk_status if "/bulk" in url else 200
+        return SimpleNamespace(status_code=status)
+
+
+def _bar(**kwargs: Any) -> Any:
+    kwargs.setdefault("push_every", 0.01)
+    return client.RemoteTqdm(file=io.StringIO(), server_url="http://test/progress", **kwargs)
+
+
+def test_close_delivers_final_payload(posted) -> None:
+    bar = _bar(total=3, task_id="final")
+    bar.update(3)
+    bar.close()
+
+    assert posted[-1]["status"] == "close"
+    assert posted[-1]["task_id"] == "final"
+    assert posted[-1]["n"] == 3
+
+
+def test_unchanged_updates_are_not_reposted(posted) -> None:
+    bar = _bar(total=10, task_id="dedup")
+    bar.update(1)
+    time.sleep(0.05)
+    bar.update(0)
+    time.sleep(0.05)
+    bar.close()
+
+    updates = [p for p in posted if p["status"] == "update"]
+    assert [p["n"] for p in updates] == [1]
+
+
+def test_pushes_never_come_sooner_than_push_every(monkeypatch) -> None:
+    pushed: Dict[str, List[float]] = {}
+
+    def record(payload: Dict[str, Any]) -> None:
+        if payload["status"] == "update":
+            pushed.setdefault(payload["task_id"], []).append(time.monotonic())
+
+    monkeypatch.setattr(client.RemoteTqdmMixin, "_post", lambda self, payload: record(payload))
+    monkeypatch.setattr(
+        client.RemoteTqdmMixin, "_post_bulk", lambda self, payloads: [record(p) for p in payloads]
+    )
+    intervals = {"first": 0.1, "second": 0.07}
+    first = _bar(total=1000, task_id="first", push_every=intervals["first"])
+    time.sleep(0.08)
+    second = _bar(total=1000, task_id="second", push_every=intervals["second"])
+    deadline = time.monotonic() + 0.8
+    while time.monotonic() < deadline:
+        first.update(1)
+        second.update(1)
+        time.sleep(0.005)
+    first.close()
+    second.close()
+
+    for task_id, stamps in pushed.items():
+        assert len(stamps) > 2
+        assert min(b - a for a, b in zip(stamps, stamps[1:])) >= intervals[task_id] - 0.005
+
+
+def test_set_description_only_emits_changes(posted) -> None:
+    bar = _bar(total=10, task_id="desc")
+    emitted: List[str] = []
+    bar._submit = lambda payload: emitted.append(payload["desc"])
+
+    bar.set_description("stage 1")
+    bar.set_description("stage 1")
+    bar.set_description("stage 2")
+
+    del bar._submit
+    bar.close()
+    assert emitted == ["stage 1: ", "stage 2: "]
+
+
+def test_remote_mixin_composes_with_other_tqdm_bases(posted) -> None:
+    from tqdm.asyncio import tqdm as asyncio_tqdm
+
+    remote_cls = client.make_remote_tqdm(asyncio_tqdm)
+    combined = type("Combined", (remote_cls, client.RemoteTqdm), {})
+
+    bar = combined(total=2, file=io.StringIO(), server_url="http://test/progress")
+    bar.update(2)
+    bar.close()
+
+    assert "_task_id" not in vars(bar)
+    assert posted[-1]["status"] == "close"
+
+
+def test_default_task_ids_include_a_per_process_seed(posted, monkeypatch) -> None:
+    first = _bar(total=1)
+    monkeypatch.setattr(client, "_PROCESS_SEED", "restart")
+    second = _bar(total=1)
+    first.close()
+    second.close()
+
+    assert first._task_id.split(":")[-2] != "restart"
+    assert second._task_id.split(":")[-2] == "restart"
+    assert first._task_id != second._task_id
+
+
+def test_dumps_accepts_meta_orjson_rejects() -> None:
+    encoded = client._dumps({"task_id": "t", "meta": {0: "gpu", "big": 2**70}})
+
+    assert json.loads(encoded) == {"task_id": "t", "meta": {"0": "gpu", "big": 2**70}}
+
+
+def test_parse_udp_url() -> None:
+    assert client._parse_udp_url("udp://127.0.0.1:9000") == ("127.0.0.1", 9000)
+    assert client._parse_udp_url("http://127.0.0.1:9000/progress") is None
+    with pytest.raises(ValueError):
+        client._parse_udp_url("udp://127.0.0.1")
+    with pytest.raises(ValueError):
+        client._parse_udp_url("udp://127.0.0.1:notaport")
+
+
+def test_malformed_udp_url_is_rejected_at_construction(posted) -> None:
+    with pytest.raises(ValueError, match="udp://"):
+        client.RemoteTqdm(file=io.StringIO(), server_url="udp://progress.internal")
+
+
+def test_zero_push_interval_posts_inline(posted) -> None:
+    bar = _bar(total=3, task_id="sync", push_every=0)
+    bar.update(1)
+    bar.update(1)
+
+    assert [p["n"] for p in posted if p["status"] == "update"] == [1, 2]
+    bar.close()
+    assert posted[-1]["status"] == "close"
+
+
+def test_bulk_post_keeps_query_and_skips_unencodable_payloads(monkeypatch) -> None:
+    session = _FakeSession()
+    monkeypatch.setattr(client, "_SESSION", session)
+    monkeypatch.setattr(client, "_BULK_UNSUPPORTED", set())
+    bar = client.RemoteTqdm(
+        file=io.StringIO(), server_url="http://test/progress?token=abc", push_every=0
+    )
+
+    bar._post_bulk([{"task_id": "ok", "n": 1}, {"task_id": "bad", "meta": {"s": {1}}}])
+    bar.close()
+
+    bulk = [(url, data) for url, data in session.calls if "/bulk" in url]
+    assert [url for url, _ in bulk] == ["http://test/progress/bulk?token=abc"]
+    assert json.loads(bulk[0][1]) == [{"task_id": "ok", "n": 1}]
+
+
+def test_bulk_post_falls_back_to_single_posts_on_404(monkeypatch) -> None:
+    session = _FakeSession(bulk_status=404)
+    monkeypatch.setattr(client, "_SESSION", session)
+    monkeypatch.setattr(client, "_BULK_UNSUPPORTED", set())
+    bar = client.RemoteTqdm(file=io.StringIO(), server_url="http://test/progress", push_every=0)
+    session.calls.clear()
+
+    bar._post_bulk([{"task_id": "a"}, {"task_id": "b"}])
+    bar._post_bulk([{"task_id": "c"}, {"task_id": "d"}])
+    bar.close()
+
+    urls = [url for url, _ in session.calls]
+    assert urls[:6] == ["http://test/progress/bulk"] + ["http://test/progress"] * 5
+    assert [json.loads(data)["task_id"] for _, data in session.calls[1:5]] == ["a", "b", "c", "d"]
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+def test_forked_child_gets_fresh_pusher_state() -> None:
+    cls = client.RemoteTqdmMixin
+    parent_session = client._SESSION
+    with cls._GLOBAL_PENDING_LOCK:
+        cls._GLOBAL_PENDING.add(object())  # type: ignore[arg-type]
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            healthy = (
+                not cls._GLOBAL_PENDING_LOCK.locked()
+                and not cls._GLOBAL_PENDING
+                and cls._GLOBAL_THREAD is None
+                and client._SESSION is not parent_session
+            )
+            os._exit(0 if healthy else 1)
+        cls._GLOBAL_PENDING.clear()
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
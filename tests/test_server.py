@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from progressista.server import _loads, create_app
+from progressista.settings import ServerSettings
+
+
+def _client(**overrides) -> TestClient:
+    return TestClient(create_app(ServerSettings(**overrides)))
+
+
+def test_bulk_progress_applies_every_event() -> None:
+    with _client() as client:
+        response = client.post(
+            "/progress/bulk",
+            json=[
+                {"task_id": "a", "n": 1, "total": 10, "desc": "first"},
+                {"task_id": "b", "n": 5, "total": 5, "status": "close"},
+            ],
+        )
+        assert response.status_code == 200
+        assert response.json() == {"ok": True, "count": 2}
+
+        tasks = client.get("/tasks").json()["tasks"]
+        assert tasks["a"]["n"] == 1
+        assert tasks["a"]["status"] == "update"
+        assert tasks["b"]["status"] == "close"
+
+
+def test_bulk_progress_requires_token() -> None:
+    with _client(api_tokens=frozenset({"secret"})) as client:
+        payload = [{"task_id": "a", "n": 1}]
+        assert client.post("/progress/bulk", json=payload).status_code == 401
+
+        response = client.post(
+            "/progress/bulk",
+            json=payload,
+            headers={"Authorization": "Bearer secret"},
+        )
+        assert response.status_code == 200
+
+
+def test_invalid_progress_body_is_rejected() -> None:
+    with _client() as client:
+        assert client.post("/progress", json={"n": 1}).status_code == 422
+        assert client.post("/progress/bulk", content=b"[{").status_code == 422
+        assert client.get("/tasks").json()["tasks"] == {}
+
+
+def test_bulk_delete_filters_by_status() -> None:
+    with _client() as client:
+        for task_id, status in (("a", "close"), ("b", "update"), ("c", "close")):
+            client.post("/progress", json={"task_id": task_id, "status": status})
+
+        assert client.delete("/tasks", params={"status": "close"}).json()["removed"] == ["a", "c"]
+        assert client.delete("/tasks", params={"older_than": 3600}).json()["removed"] == []
+        assert list(client.get("/tasks").json()["tasks"]) == ["b"]
+
+
+def test_cleanup_removes_closed_and_marks_idle_tasks_stale() -> None:
+    with _client(cleanup_interval=0.02, retention_seconds=0.01, stale_seconds=0.01) as client:
+        client.post("/progress", json={"task_id": "done", "status": "close"})
+        client.post("/progress", json={"task_id": "idle", "n": 1})
+        time.sleep(0.2)
+        tasks = client.get("/tasks").json()["tasks"]
+
+    assert list(tasks) == ["idle"]
+    assert tasks["idle"]["status"] == "stale"
+
+
+def test_openapi_documents_progress_bodies() -> None:
+    paths = create_app(ServerSettings()).openapi()["paths"]
+
+    single = paths["/progress"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    bulk = paths["/progress/bulk"]["post"]["requestBody"]["content"]["application/json"]["schema"]
+    assert single["title"] == "ProgressEvent"
+    assert "task_id" in single["required"]
+    assert bulk["type"] == "array"
+    assert bulk["items"] == single
+
+
+def test_meta_with_huge_integers_is_served_and_broadcast(tmp_path) -> None:
+    storage = tmp_path / "state.json"
+    with _client(storage_path=str(storage)) as client:
+        with client.websocket_connect("/ws") as ws:
+            ws.receive_json()
+            client.post("/progress", json={"task_id": "big", "meta": {"id": 2**70}})
+            assert client.get("/tasks").json()["tasks"]["big"]["meta"]["id"] == 2**70
+            assert ws.receive_json()["tasks"]["big"]["meta"]["id"] == 2**70
+            client.post("/progress", json={"task_id": "next", "n": 1})
+            assert "next" in ws.receive_json()["tasks"]
+
+    assert "big" in _loads(storage.read_bytes())["tasks"]
+
+
+def test_tasks_survive_restart_with_storage(tmp_path) -> None:
+    storage = str(tmp_path / "state.json")
+    with _client(storage_path=storage) as client:
+        client.post("/progress", json={"task_id": "job", "n": 3, "total": 9, "desc": "café"})
+
+    with _client(storage_path=storage) as client:
+        task = client.get("/tasks").json()["tasks"]["job"]
+
+    assert task["n"] == 3
+    assert task["desc"] == "café"
+    assert task["status"] == "recovered"
+
+
+def test_task_log_is_replayed_on_startup(tmp_path) -> None:
+    storage = tmp_path / "state.json"
+    storage.with_name("state.json.log").write_text(
+        '{"task_id": "a", "task": {"task_id": "a", "n": 1, "status": "update"}}\n'
+        '{"task_id": "b", "task": {"task_id": "b", "n": 2, "status": "update"}}\n'
+        '{"task_id": "a", "removed": true}\n'
+        '{"task_id": "b", "task": {"task_id": "b", "n": 5, "st'
+    )
+
+    with _client(storage_path=str(storage)) as client:
+        tasks = client.get("/tasks").json()["tasks"]
+
+    assert list(tasks) == ["b"]
+    assert tasks["b"]["n"] == 2
+
+
+def test_updates_after_a_torn_log_survive_another_crash(tmp_path) -> None:
+    storage = tmp_path / "state.json"
+    log = storage.with_name("state.json.log")
+    log.write_text(
+        '{"task_id": "old", "task": {"task_id": "old", "n": 1, "status": "update"}}\n'
+        '{"task_id": "old", "task": {"n": 4'
+    )
+
+    with _client(storage_path=str(storage), flush_interval=0.01) as client:
+        client.post("/progress", json={"task_id": "new", "n": 2})
+        time.sleep(0.1)
+        # Simulate a crash: read what is on disk before shutdown compacts it.
+        snapshot, log_lines = storage.read_bytes(), log.read_bytes()
+
+    storage.write_bytes(snapshot)
+    log.write_bytes(log_lines)
+    tasks = create_app(ServerSettings(storage_path=str(storage))).state.tasks
+
+    assert tasks["old"]["n"] == 1
+    assert tasks["new"]["n"] == 2
+
+
+def test_storage_path_ending_in_log_keeps_its_tasks(tmp_path) -> None:
+    storage = str(tmp_path / "state.log")
+    with _client(storage_path=storage, flush_interval=0.01) as client:
+        client.post("/progress", json={"task_id": "a", "n": 1})
+        time.sleep(0.1)
+
+    for _ in range(2):
+        with _client(storage_path=storage) as client:
+            assert client.get("/tasks").json()["tasks"]["a"]["n"] == 1
+
+
+def test_websocket_receives_snapshot_after_update() -> None:
+    with _client() as client:
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json()["tasks"] == {}
+            client.post("/progress", json={"task_id": "live", "n": 1, "total": 2})
+            assert ws.receive_json()["tasks"]["live"]["n"] == 1
+
+
+def test_slow_websocket_keeps_newest_snapshot(monkeypatch) -> None:
+    from starlette.websockets import WebSocket
+
+    gate = threading.Event()
+    sends = []
+    original_send_text = WebSocket.send_text
+
+    async def slow_send_text(self, data: str) -> None:
+        sends.append(data)
+        # Let the initial snapshot through, then stall until the queue overflows.
+        while len(sends) > 1 and not gate.is_set():
+            await asyncio.sleep(0.01)
+        await original_send_text(self, data)
+
+    monkeypatch.setattr(WebSocket, "send_text", slow_send_text)
+    with _client(flush_interval=0.01) as client:
+        with client.websocket_connect("/ws") as ws:
+            assert ws.receive_json()["tasks"] == {}
+            for n in range(1, 41):
+                client.post("/progress", json={"task_id": "slow", "n": n, "total": 40})
+                time.sleep(0.02)
+            gate.set()
+            received = []
+            while not received or received[-1] != 40:
+                received.append(ws.receive_json()["tasks"]["slow"]["n"])
+            # Stale frames were dropped, but the watcher stayed connected.
+            assert len(received) < 40
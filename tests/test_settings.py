@@ -16,14 +16,27 @@ def test_server_settings_reads_environment(monkeypatch) -> None:
     monkeypatch.setenv("PROGRESSISTA_CLEANUP_INTERVAL", "7.5")
 
     settings_module = _reload_settings_module()
-    settings = settings_module.ServerSettings()
+    settings = settings_module.ServerSettings.from_env()
 
     assert settings.allow_origins == ("https://a.example", "https://b.example")
-    assert settings.api_tokens == ("alpha", "beta")
+    assert settings.api_tokens == frozenset({"alpha", "beta"})
     assert settings.cleanup_interval == 7.5
     sys.modules.pop("progressista.settings", None)
 
 
+def test_server_settings_from_env_sees_later_changes(monkeypatch) -> None:
+    from progressista.settings import ServerSettings
+
+    monkeypatch.setenv("PROGRESSISTA_PORT", "9100")
+    monkeypatch.setenv("PROGRESSISTA_API_TOKEN", "solo")
+
+    settings = ServerSettings.from_env()
+
+    assert settings.port == 9100
+    assert settings.api_tokens == frozenset({"solo"})
+    assert ServerSettings().port == 8000
+
+
 def test_client_settings_defaults_can_be_overridden(monkeypatch) -> None:
     monkeypatch.setenv("PROGRESSISTA_SERVER_URL", "https://example/api")
     monkeypatch.setenv("PROGRESSISTA_PUSH_INTERVAL", "1.5")